@@ -12,10 +12,10 @@ def get_launcher():
     from .__main__ import TaskfileLauncher
     return TaskfileLauncher
 
-def launch(taskfile_path=None):
+def launch(taskfile_path=None, once=False):
     """启动 Taskfile 选择器"""
     from .__main__ import launch as _launch
-    return _launch(taskfile_path)
+    return _launch(taskfile_path, once=once)
 
 def start():
     """一键启动 Taskfile 选择器"""
@@ -5,21 +5,62 @@ Taskfile 启动器核心模块
 
 import os
 import sys
-import subprocess
-import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import List, Optional, Tuple
 
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
+# yaml、rich、subprocess、json、hashlib、textwrap 均按需导入，-h 等简单调用无需加载它们
 
-console = Console()
+USAGE = """用法: lata [--once] [Taskfile 路径]
+
+交互式选择并执行 Taskfile 中的任务。
+未指定路径时使用当前工作目录下的 Taskfile.yml。
+
+选项:
+  --once      只执行一个任务后退出（非 Windows 下由 task 直接替换当前进程）
+  -h, --help  显示此帮助信息并退出"""
+
+# 启动器只会用到任务的这几个字段，快速扫描时只提取它们
+_TASK_FIELDS = ('desc', 'summary', 'prompt')
+
+# 缓存内容格式版本，缓存的字段或结构变化时递增，使旧缓存失效
+_CACHE_VERSION = 1
+
+_console_instance = None
+
+def _prompt_kind(info) -> str:
+    """根据任务的 prompt 字段判断输入类型: yesno / text / none"""
+    prompt_text = info.get('prompt') if isinstance(info, dict) else None
+    if prompt_text is None or prompt_text == '':
+        return 'none'
+    # 与 go-task 一致，yes、123 等非字符串值也按提示文本处理
+    return 'yesno' if "y/N" in str(prompt_text) else 'text'
+
+def _console():
+    """获取共享的 Rich Console，首次使用时才导入 rich"""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console(highlight=False, soft_wrap=True, emoji=False, markup=True)
+    return _console_instance
+
+def __getattr__(name):
+    # 保留原有的模块级 console 名称，访问时才创建
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class TaskfileLauncher:
-    def __init__(self, taskfile_path: Path = None):
+    # 标题内容固定，Panel 首次使用时构建并在实例间共享
+    _header_panel = None
+
+    def __init__(self, taskfile_path: Path = None, once: bool = False):
         self.taskfile_path = taskfile_path or self._find_taskfile()
+        # 单次模式下选中任务后用 task 替换当前进程，不再返回菜单
+        self.once = once
         self.tasks = {}
+        # 子进程环境只复制一次，每次执行任务时仅更新 CLI_ARGS
+        self._base_env = os.environ.copy()
+        self._menu = None
         self._load_taskfile()
     
     def _find_taskfile(self) -> Path:
@@ -34,65 +75,255 @@ class TaskfileLauncher:
             # 如果脚本目录没有，则使用当前工作目录
         return Path("Taskfile.yml")
     
+    def _cache_path(self) -> Path:
+        """解析结果的 JSON 缓存路径，位于当前用户的缓存目录，按 Taskfile 绝对路径区分"""
+        import hashlib
+
+        if os.name == 'nt':
+            base = os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local'
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        key = hashlib.blake2b(str(self.taskfile_path.resolve()).encode()).hexdigest()[:16]
+        return Path(base) / 'lata' / f"tasks-{key}.json"
+
+    def _load_cached_tasks(self, cache_path: Path, src_stamp: list) -> Optional[dict]:
+        """读取 JSON 缓存，缓存缺失、损坏、已过期或不属于当前用户时返回 None"""
+        import json
+
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                # 只信任当前用户自己写入的缓存
+                if hasattr(os, 'getuid') and os.fstat(f.fileno()).st_uid != os.getuid():
+                    return None
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (not isinstance(cached, dict)
+                or cached.get('version') != _CACHE_VERSION
+                or cached.get('src_stamp') != src_stamp):
+            return None
+        return cached.get('tasks')
+
+    def _save_cached_tasks(self, cache_path: Path, src_stamp: list):
+        """写入 JSON 缓存，失败时静默忽略（缓存只是加速手段）"""
+        import json
+
+        # JSON 会把 1: 这类非字符串任务名变成 "1"，冷启动和暖启动结果将不一致，此时不写缓存
+        if not all(isinstance(name, str) for name in self.tasks or {}):
+            return
+
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'src_stamp': src_stamp, 'tasks': self.tasks},
+                          f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            tmp_path.unlink(missing_ok=True)
+
+    def _quick_scan_tasks(self, yaml, loader) -> Optional[dict]:
+        """基于 YAML 事件流只提取任务名及 desc/summary/prompt，跳过其余内容
+
+        标量按与 safe_load 相同的规则解析类型；任务中出现别名、合并键、
+        非字符串键，或字段值不是字符串/null 等无法可靠处理的情况时返回 None，
+        由调用方回退到完整解析。
+        """
+        resolver = yaml.resolver.Resolver()
+        str_tag = 'tag:yaml.org,2002:str'
+        null_tag = 'tag:yaml.org,2002:null'
+        merge_tag = 'tag:yaml.org,2002:merge'
+
+        def resolve(event):
+            # 与 Composer 一致：未显式指定标签时按隐式规则推断
+            if event.tag is None or event.tag == '!':
+                return resolver.resolve(yaml.ScalarNode, event.value, event.implicit)
+            return event.tag
+
+        def is_str_key(event):
+            # 合并键 << 解析为 merge 标签，也会在这里被排除
+            return isinstance(event, yaml.ScalarEvent) and resolve(event) == str_tag
+
+        container_start = (yaml.MappingStartEvent, yaml.SequenceStartEvent)
+        container_end = (yaml.MappingEndEvent, yaml.SequenceEndEvent)
+
+        def skip(event):
+            # 跳过一个值（标量、别名或整个映射/序列）
+            depth = 1 if isinstance(event, container_start) else 0
+            while depth:
+                event = next(events)
+                if isinstance(event, container_start):
+                    depth += 1
+                elif isinstance(event, container_end):
+                    depth -= 1
+
+        def scan_task():
+            info = {}
+            while True:
+                key = next(events)
+                if isinstance(key, yaml.MappingEndEvent):
+                    return info
+                if not is_str_key(key):
+                    return None
+                value = next(events)
+                if key.value in _TASK_FIELDS:
+                    if not isinstance(value, yaml.ScalarEvent):
+                        return None
+                    tag = resolve(value)
+                    if tag == str_tag:
+                        info[key.value] = value.value
+                    elif tag == null_tag:
+                        info[key.value] = None
+                    else:
+                        return None
+                else:
+                    skip(value)
+
+        def scan_tasks():
+            tasks = {}
+            while True:
+                key = next(events)
+                if isinstance(key, yaml.MappingEndEvent):
+                    return tasks
+                value = next(events)
+                if not is_str_key(key) or isinstance(value, yaml.AliasEvent):
+                    return None
+                if isinstance(value, yaml.MappingStartEvent):
+                    info = scan_task()
+                    if info is None:
+                        return None
+                    tasks[key.value] = info
+                else:
+                    # 命令列表等简写形式没有可用字段
+                    skip(value)
+                    tasks[key.value] = {}
+
+        # 以二进制方式读取，由 libyaml 自行解码 UTF-8，省去 Python 层的文本解码
+        with open(self.taskfile_path, 'rb') as f:
+            events = yaml.parse(f, Loader=loader)
+            try:
+                event = next(events)
+                while isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+                    event = next(events)
+                if not isinstance(event, yaml.MappingStartEvent):
+                    return None
+
+                # 在根映射中定位 tasks，其余顶层键整体跳过；
+                # 需扫描完整个根映射，以便发现重复的 tasks 键
+                tasks = None
+                while True:
+                    key = next(events)
+                    if isinstance(key, yaml.MappingEndEvent):
+                        return {} if tasks is None else tasks
+                    if not isinstance(key, yaml.ScalarEvent) or resolve(key) == merge_tag:
+                        # 复杂键无法按键值对逐个跳过；根映射的合并键可能引入 tasks
+                        return None
+                    value = next(events)
+                    if is_str_key(key) and key.value == 'tasks':
+                        # 重复的 tasks 键在 safe_load 中以最后一个为准，交给完整解析
+                        if tasks is not None or not isinstance(value, yaml.MappingStartEvent):
+                            return None
+                        tasks = scan_tasks()
+                        if tasks is None:
+                            return None
+                    else:
+                        skip(value)
+            except StopIteration:
+                return None
+
+    def _parse_taskfile(self) -> dict:
+        """解析 Taskfile.yml 中的任务，优先使用快速扫描"""
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+        tasks = self._quick_scan_tasks(yaml, loader)
+        if tasks is not None:
+            return tasks
+
+        # 结构超出快速扫描的处理范围，回退到完整解析
+        with open(self.taskfile_path, 'rb') as f:
+            data = yaml.load(f, Loader=loader)
+
+        return data.get('tasks', {})
+
     def _load_taskfile(self):
-        """加载 Taskfile.yml 并解析任务"""
+        """加载 Taskfile.yml 并解析任务，Taskfile 未修改时直接使用 JSON 缓存"""
         try:
-            with open(self.taskfile_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            self.tasks = data.get('tasks', {})
+            # 以纳秒级修改时间和文件大小判断 Taskfile 是否变化
+            st = os.stat(self.taskfile_path)
+            src_stamp = [st.st_mtime_ns, st.st_size]
+            cache_path = self._cache_path()
+
+            tasks = self._load_cached_tasks(cache_path, src_stamp)
+            if tasks is not None:
+                self.tasks = tasks
+            else:
+                self.tasks = self._parse_taskfile()
+                self._save_cached_tasks(cache_path, src_stamp)
             
         except Exception as e:
-            console.print(f"[red]加载 Taskfile 失败: {e}[/red]")
+            _console().print(f"[red]加载 Taskfile 失败: {e}[/red]")
             sys.exit(1)
+
+        # 任务列表加载后不再变化，菜单用到的名称和选项只计算一次
+        self._task_names = tuple(name for name in self.tasks if name != 'default')
+        self._choices = tuple(str(i) for i in range(len(self._task_names) + 1))
+        self._prompt_kind = {name: _prompt_kind(info) for name, info in self.tasks.items()}
     
-    def _display_tasks(self):
-        """显示所有可用任务"""
-        console.print(Panel.fit(
-            "[bold blue]Taskfile 任务选择器[/bold blue]",
-            border_style="blue"
-        ))
-        
-        try:
-            # 直接使用 task --list 显示任务列表
-            result = subprocess.run(
-                ['task', '--taskfile', str(self.taskfile_path), '--list'],
-                cwd=self.taskfile_path.parent,
-                text=True,
-                encoding='utf-8',
-                errors='replace'
-            )
-            
-            if result.returncode == 0:
-                console.print(result.stdout)
-            else:
-                console.print(f"[red]获取任务列表失败: {result.stderr}[/red]")
-                
-        except Exception as e:
-            console.print(f"[red]执行 task --list 失败: {e}[/red]")
-    
-    def _select_task(self) -> Optional[str]:
-        """交互式选择任务"""
-        self._display_tasks()
+    @classmethod
+    def _header(cls):
+        """任务选择器标题，输出不是终端时直接使用纯文本"""
+        if not _console().is_terminal:
+            return "Taskfile 任务选择器"
 
-        task_names = [name for name in self.tasks.keys() if name != 'default']
+        if cls._header_panel is None:
+            from rich.panel import Panel
+            cls._header_panel = Panel.fit("[bold blue]Taskfile 任务选择器[/bold blue]", border_style="blue")
+        return cls._header_panel
 
-        while True:
-            try:
-                console.print("\n[yellow]请选择要执行的任务:[/yellow]")
+    def _menu_frame(self):
+        """标题、任务表和选项组成的菜单，任务加载后不再变化，只构建一次"""
+        if self._menu is not None:
+            return self._menu
+
+        import textwrap
+        from rich.console import Group
+        from rich.table import Table
+
+        # 直接使用已解析的任务渲染列表，无需再调用 task --list
+        table = Table(show_header=True)
+        table.add_column("任务名", style="cyan")
+        table.add_column("描述", style="white")
 
-                # 显示任务选项
-                for i, task_name in enumerate(task_names, 1):
-                    console.print(f"  [cyan]{i}[/cyan]. {task_name}")
+        for name, info in self.tasks.items():
+            # 任务也可能是命令列表的简写形式，没有 desc/summary
+            info = info if isinstance(info, dict) else {}
+            desc = info.get('desc', '') or info.get('summary', '')
+            table.add_row(name, textwrap.shorten(str(desc), width=60, placeholder="...") if desc else "")
 
-                console.print(f"  [cyan]0[/cyan]. 退出")
-                console.print("[dim]提示: 按 Ctrl+C 可随时安全退出[/dim]")
+        lines = ["\n[yellow]请选择要执行的任务:[/yellow]"]
+        lines += [f"  [cyan]{i}[/cyan]. {task_name}" for i, task_name in enumerate(self._task_names, 1)]
+        lines += ["  [cyan]0[/cyan]. 退出", "[dim]提示: 按 Ctrl+C 可随时安全退出[/dim]"]
 
-                choice = Prompt.ask(
-                    "[bold green]请输入选项编号[/bold green]",
-                    choices=[str(i) for i in range(len(task_names) + 1)],
-                    default="1"
-                )
+        self._menu = Group(self._header(), table, "\n".join(lines))
+        return self._menu
+
+    def _render_menu_and_select(self) -> Optional[str]:
+        """显示任务列表并交互式选择任务"""
+        task_names = self._task_names
+
+        # 标题、任务表和选项合并为一次输出
+        _console().print(self._menu_frame())
+
+        while True:
+            try:
+                # 常规输入路径直接用 input()，只有出错时才经过 Rich
+                choice = input("请输入选项编号 [1]: ").strip() or "1"
+
+                if choice not in self._choices:
+                    _console().print("[red]无效选项，请重新输入[/red]")
+                    continue
 
                 if choice == "0":
                     return None
@@ -100,77 +331,110 @@ class TaskfileLauncher:
                 return task_names[int(choice) - 1]
 
             except KeyboardInterrupt:
-                console.print("\n[yellow]检测到 Ctrl+C，正在安全退出...[/yellow]")
+                _console().print("\n[yellow]检测到 Ctrl+C，正在安全退出...[/yellow]")
                 return None
             except EOFError:
-                console.print("\n[yellow]检测到输入结束，正在退出...[/yellow]")
+                _console().print("\n[yellow]检测到输入结束，正在退出...[/yellow]")
                 return None
     
     def _get_task_input(self, task_name: str) -> Optional[str]:
         """获取任务所需的输入参数"""
-        task_info = self.tasks.get(task_name, {})
-        prompt_text = task_info.get('prompt')
+        kind = self._prompt_kind.get(task_name, 'none')
 
-        if not prompt_text:
+        if kind == 'none':
             return ""
 
+        from rich.prompt import Prompt, Confirm
+
+        prompt_text = str(self.tasks[task_name]['prompt'])
+
         try:
             # 特殊处理不同类型的提示
-            if "y/N" in prompt_text:
+            if kind == 'yesno':
                 # 是/否选择
                 return "y" if Confirm.ask(f"[yellow]{prompt_text}[/yellow]", default=False) else "n"
             else:
                 # 文本输入
                 return Prompt.ask(f"[yellow]{prompt_text}[/yellow]")
         except KeyboardInterrupt:
-            console.print("\n[yellow]输入被中断，跳过此任务[/yellow]")
+            _console().print("\n[yellow]输入被中断，跳过此任务[/yellow]")
             return None
         except EOFError:
-            console.print("\n[yellow]输入结束，跳过此任务[/yellow]")
+            _console().print("\n[yellow]输入结束，跳过此任务[/yellow]")
             return None
     
+    def _prepare_task(self, task_name: str, user_input: str = "") -> Tuple[List[str], dict]:
+        """显示任务提示，并构建执行任务所需的 task 命令和环境变量"""
+        _console().print(f"[blue]执行任务: {task_name}[/blue]")
+        
+        cmd = ['task', '--taskfile', str(self.taskfile_path), task_name]
+        
+        # 如果有用户输入，添加到命令中
+        if user_input:
+            cmd.append(user_input)
+        
+        env = self._base_env
+        env['CLI_ARGS'] = user_input
+        return cmd, env
+    
+    def _exec_task(self, task_name: str, user_input: str = "") -> int:
+        """用 task 替换当前进程执行任务，仅在 exec 失败时返回"""
+        # Windows 上 exec 只是启动新进程后让当前进程退出，
+        # 命令行会提前拿回控制台，因此改为普通方式等待任务结束
+        if os.name == 'nt':
+            return self._run_task(task_name, user_input)
+
+        try:
+            cmd, env = self._prepare_task(task_name, user_input)
+            
+            # exec 不会执行 Python 的清理流程，需先刷新已缓冲的输出
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.chdir(self.taskfile_path.parent)
+            os.execvpe(cmd[0], cmd, env)
+        except Exception as e:
+            _console().print(f"[red]执行任务时出错: {e}[/red]")
+            return 1
+    
     def _run_task(self, task_name: str, user_input: str = "") -> int:
         """执行指定的任务"""
+        import subprocess
+
         try:
-            console.print(f"[blue]执行任务: {task_name}[/blue]")
-            
-            # 构建命令
-            cmd = ['task', '--taskfile', str(self.taskfile_path), task_name]
-            
-            # 如果有用户输入，添加到命令中
-            if user_input:
-                cmd.append(user_input)
+            cmd, env = self._prepare_task(task_name, user_input)
             
             # 执行命令
             result = subprocess.run(
                 cmd,
                 cwd=self.taskfile_path.parent,
-                env=dict(os.environ, CLI_ARGS=user_input)
+                env=env
             )
             
             return result.returncode
             
         except KeyboardInterrupt:
-            console.print("\n[yellow]任务被用户中断[/yellow]")
+            _console().print("\n[yellow]任务被用户中断[/yellow]")
             return 0
         except Exception as e:
-            console.print(f"[red]执行任务时出错: {e}[/red]")
+            _console().print(f"[red]执行任务时出错: {e}[/red]")
             return 1
     
     def run(self) -> int:
         """运行交互式任务选择器"""
-        console.print(f"[blue]正在使用的 Taskfile: {self.taskfile_path.resolve()}[/blue]")
+        from rich.prompt import Confirm
+
+        _console().print(f"[blue]正在使用的 Taskfile: {self.taskfile_path.resolve()}[/blue]")
         
         if not self.taskfile_path.exists():
-            console.print(f"[red]错误: Taskfile 不存在: {self.taskfile_path}[/red]")
+            _console().print(f"[red]错误: Taskfile 不存在: {self.taskfile_path}[/red]")
             return 1
 
         try:
             while True:
-                task_name = self._select_task()
+                task_name = self._render_menu_and_select()
 
                 if task_name is None:
-                    console.print("[yellow]退出任务选择器[/yellow]")
+                    _console().print("[yellow]退出任务选择器[/yellow]")
                     return 0
 
                 # 获取任务输入
@@ -180,53 +444,66 @@ class TaskfileLauncher:
                 if user_input is None:
                     continue
 
+                # 单次模式执行完这一个任务即退出（非 Windows 下由 task 直接替换当前进程）
+                if self.once:
+                    return self._exec_task(task_name, user_input)
+
                 # 执行任务
                 result = self._run_task(task_name, user_input)
 
                 if result != 0:
-                    console.print(f"[red]任务 '{task_name}' 执行失败 (退出码: {result})[/red]")
+                    _console().print(f"[red]任务 '{task_name}' 执行失败 (退出码: {result})[/red]")
                 else:
-                    console.print(f"[green]任务 '{task_name}' 执行成功[/green]")
+                    _console().print(f"[green]任务 '{task_name}' 执行成功[/green]")
 
                 # 询问是否继续
                 try:
                     if not Confirm.ask("\n[yellow]是否继续选择其他任务?[/yellow]", default=False):
                         break
                 except KeyboardInterrupt:
-                    console.print("\n[yellow]检测到 Ctrl+C，正在安全退出...[/yellow]")
+                    _console().print("\n[yellow]检测到 Ctrl+C，正在安全退出...[/yellow]")
                     break
                 except EOFError:
-                    console.print("\n[yellow]检测到输入结束，正在退出...[/yellow]")
+                    _console().print("\n[yellow]检测到输入结束，正在退出...[/yellow]")
                     break
 
         except KeyboardInterrupt:
-            console.print("\n[yellow]程序被用户中断，正在安全退出...[/yellow]")
+            _console().print("\n[yellow]程序被用户中断，正在安全退出...[/yellow]")
             return 0
         except Exception as e:
-            console.print(f"[red]程序运行时出现错误: {e}[/red]")
+            _console().print(f"[red]程序运行时出现错误: {e}[/red]")
             return 1
 
         return 0
 
-def launch(taskfile_path: Path = None) -> int:
+def launch(taskfile_path: Path = None, once: bool = False) -> int:
     """启动 Taskfile 选择器的便捷函数"""
-    launcher = TaskfileLauncher(taskfile_path)
+    launcher = TaskfileLauncher(taskfile_path, once=once)
     return launcher.run()
 
 def main():
     """主入口函数"""
+    # 帮助信息使用普通 print，避免导入 rich/yaml
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        print(USAGE)
+        sys.exit(0)
+
     try:
+        args = sys.argv[1:]
+        once = "--once" in args
+        args = [arg for arg in args if arg != "--once"]
+
         # 支持命令行参数指定 Taskfile 路径
-        if len(sys.argv) > 1:
-            taskfile_path = Path(sys.argv[1])
-            sys.exit(launch(taskfile_path))
+        if args:
+            taskfile_path = Path(args[0])
+            sys.exit(launch(taskfile_path, once=once))
         else:
-            sys.exit(launch())
+            sys.exit(launch(once=once))
     except KeyboardInterrupt:
-        console.print("\n[yellow]程序被用户中断，已安全退出[/yellow]")
+        _console().print("\n[yellow]程序被用户中断，已安全退出[/yellow]")
         sys.exit(0)
     except Exception as e:
-        console.print(f"[red]程序启动失败: {e}[/red]")
+        _console().print(f"[red]程序启动失败: {e}[/red]")
         sys.exit(1)
         
 if __name__ == "__main__":
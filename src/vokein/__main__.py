@@ -6,70 +6,72 @@
 import sys
 import subprocess
 from pathlib import Path
-from invoke import task, Collection, Context
+from invoke import task, Context
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 
-console = Console()
+console = Console(highlight=False, soft_wrap=True, emoji=False, markup=True)
 
 # ==================== 任务定义 ====================
 
+def _run(argv) -> int:
+    """运行子进程并返回退出码
+
+    保持继承的标准输入输出，nameu 才能检测到终端、实时显示进度并正常读取输入。
+    """
+    return subprocess.run(argv).returncode
+
 @task()
 def standard_multi(c):
     """标准多画师模式 - 会添加画师名后缀"""
-    cmd = f"python -m nameu --mode multi --clipboard --keep-timestamp"
-    subprocess.run(cmd, shell=True)
+    return _run([sys.executable, "-m", "nameu", "--mode", "multi", "--clipboard", "--keep-timestamp"])
 
 @task()
 def standard_single(c):
     """标准单画师模式 - 会添加画师名后缀"""
-    cmd = f"python -m nameu --mode single --clipboard --keep-timestamp"
-    subprocess.run(cmd, shell=True)
+    return _run([sys.executable, "-m", "nameu", "--mode", "single", "--clipboard", "--keep-timestamp"])
 
 @task()
 def no_artist_mode(c):
     """无画师模式 - 不添加画师名后缀的重命名模式"""
-    cmd = f"python -m nameu --no-artist --clipboard --keep-timestamp"
-    subprocess.run(cmd, shell=True)
+    return _run([sys.executable, "-m", "nameu", "--no-artist", "--clipboard", "--keep-timestamp"])
 
 @task()
 def no_sensitive_convert(c):
     """无敏感词转换 - 不将敏感词转换为拼音的模式"""
-    cmd = f"python -m nameu --mode multi --clipboard --keep-timestamp --no-convert-sensitive"
-    subprocess.run(cmd, shell=True)
+    return _run([sys.executable, "-m", "nameu", "--mode", "multi", "--clipboard", "--keep-timestamp",
+                 "--no-convert-sensitive"])
+
+# 任务列表固定，直接列出，无需通过 Collection 反射当前模块
+TASKS = [standard_multi, standard_single, no_artist_mode, no_sensitive_convert]
+
 # ==================== 启动器 ====================
 
 def vokein():
     """运行任务选择器"""
-    # 直接使用当前模块作为任务集合
-    import inspect
-    current_module = inspect.getmodule(inspect.currentframe())
+    # 与 invoke 命令行保持一致，使用短横线形式的任务名
+    tasks = [(task_obj.__name__.replace('_', '-'), task_obj) for task_obj in TASKS]
+    
+    # 任务列表固定，表格只构建一次，每轮循环直接复用
+    table = Table(title="NameU 自动唯一文件名工具", show_header=True)
+    table.add_column("编号", style="cyan", width=4)
+    table.add_column("任务名", style="yellow")
+    table.add_column("描述", style="white")
     
-    # 创建Collection并从当前模块加载任务
-    ns = Collection.from_module(current_module)
+    for i, (name, task_obj) in enumerate(tasks, 1):
+        # 修复描述获取逻辑
+        desc = task_obj.__doc__ or ""
+        if desc:
+            desc = desc.split('\n')[0].strip()
+        else:
+            desc = "无描述"
+        table.add_row(str(i), name, desc)
     
-    # 过滤掉内部任务（以_开头的）
-    tasks = [(name, task) for name, task in ns.tasks.items() 
-             if not name.startswith('_')]
+    table.add_row("0", "退出", "")
     
     while True:
         # 显示任务表格
-        table = Table(title="NameU 自动唯一文件名工具", show_header=True)
-        table.add_column("编号", style="cyan", width=4)
-        table.add_column("任务名", style="yellow")
-        table.add_column("描述", style="white")
-        
-        for i, (name, task_obj) in enumerate(tasks, 1):
-            # 修复描述获取逻辑
-            desc = task_obj.__doc__ or ""
-            if desc:
-                desc = desc.split('\n')[0].strip()
-            else:
-                desc = "无描述"
-            table.add_row(str(i), name, desc)
-        
-        table.add_row("0", "退出", "")
         console.print(table)
         
         # 选择任务
@@ -86,8 +88,11 @@ def vokein():
         task_name, task_obj = tasks[int(choice) - 1]
         try:
             console.print(f"[blue]执行: {task_name}[/blue]")
-            task_obj(Context())
-            console.print(f"[green]✓ {task_name} 完成[/green]")
+            returncode = task_obj(Context())
+            if returncode:
+                console.print(f"[red]✗ {task_name} 失败 (退出码: {returncode})[/red]")
+            else:
+                console.print(f"[green]✓ {task_name} 完成[/green]")
         except KeyboardInterrupt:
             console.print("\n[yellow]任务中断[/yellow]")
         except Exception as e:
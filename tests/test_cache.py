@@ -0,0 +1,67 @@
+"""Taskfile JSON 缓存测试"""
+
+import json
+import os
+
+import pytest
+
+from lata import __main__ as launcher_module
+from lata.__main__ import TaskfileLauncher
+
+
+@pytest.fixture
+def taskfile(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    path = tmp_path / "Taskfile.yml"
+    path.write_text("tasks:\n  a:\n    desc: first\n", encoding="utf-8")
+    return path
+
+
+def test_warm_start_uses_cache(taskfile, monkeypatch):
+    launcher = TaskfileLauncher(taskfile)
+    assert launcher._cache_path().exists()
+
+    monkeypatch.setattr(TaskfileLauncher, "_parse_taskfile", lambda self: pytest.fail("cache not used"))
+    assert TaskfileLauncher(taskfile).tasks == launcher.tasks
+
+
+def test_same_mtime_different_size_invalidates(taskfile):
+    TaskfileLauncher(taskfile)
+    st = os.stat(taskfile)
+    taskfile.write_text("tasks:\n  a:\n    desc: second!\n", encoding="utf-8")
+    os.utime(taskfile, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert TaskfileLauncher(taskfile).tasks == {"a": {"desc": "second!"}}
+
+
+def test_other_version_is_ignored(taskfile, monkeypatch):
+    launcher = TaskfileLauncher(taskfile)
+    cache_path = launcher._cache_path()
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    cached["tasks"] = {"stale": {}}
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+    assert TaskfileLauncher(taskfile).tasks == {"stale": {}}
+
+    monkeypatch.setattr(launcher_module, "_CACHE_VERSION", cached["version"] + 1)
+    assert TaskfileLauncher(taskfile).tasks == {"a": {"desc": "first"}}
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="需要 POSIX 用户 ID")
+def test_cache_owned_by_other_user_is_ignored(taskfile, monkeypatch):
+    TaskfileLauncher(taskfile)
+    uid = os.getuid()
+    monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+    monkeypatch.setattr(TaskfileLauncher, "_parse_taskfile", lambda self: {"parsed": {}})
+
+    assert TaskfileLauncher(taskfile).tasks == {"parsed": {}}
+
+
+def test_non_string_task_names_are_not_cached(taskfile):
+    taskfile.write_text("tasks:\n  1:\n    desc: numeric\n", encoding="utf-8")
+    cold = TaskfileLauncher(taskfile)
+    assert not cold._cache_path().exists()
+
+    warm = TaskfileLauncher(taskfile)
+    assert warm.tasks == cold.tasks == {1: {"desc": "numeric"}}
+    assert warm._task_names == (1,)
@@ -0,0 +1,165 @@
+"""_quick_scan_tasks 与 yaml.safe_load 的一致性测试"""
+
+import textwrap
+from pathlib import Path
+
+import pytest
+import yaml
+
+from lata.__main__ import TaskfileLauncher, _TASK_FIELDS
+
+LOADERS = [yaml.SafeLoader] + ([yaml.CSafeLoader] if hasattr(yaml, "CSafeLoader") else [])
+
+# (名称, Taskfile 内容, 快速扫描是否应回退到完整解析)
+CASES = [
+    ("null", """
+        tasks:
+          a:
+            desc: null
+            prompt: ~
+          b:
+            summary:
+            desc: "null"
+    """, False),
+    ("str", """
+        tasks:
+          a:
+            desc: 显示任务
+            prompt: "Continue? y/N"
+          b:
+            desc: !!str 123
+    """, False),
+    ("bool", """
+        tasks:
+          a:
+            prompt: yes
+    """, True),
+    ("block-scalar", """
+        tasks:
+          a:
+            summary: |
+              多行
+              说明
+            desc: >
+              folded
+              text
+    """, False),
+    ("shorthand", """
+        version: '3'
+        vars:
+          A: [1, {b: 2}]
+        tasks:
+          list: [echo 1, echo 2]
+          string: echo hi
+          empty:
+          full:
+            desc: x
+            cmds:
+              - task: list
+                vars: {X: 1}
+    """, False),
+    ("alias", """
+        common: &c
+          desc: shared
+        tasks:
+          a: *c
+    """, True),
+    ("alias-field", """
+        text: &t shared
+        tasks:
+          a:
+            desc: *t
+    """, True),
+    ("merge-key", """
+        common: &c
+          desc: shared
+        tasks:
+          a:
+            <<: *c
+            cmds: [x]
+    """, True),
+    ("root-merge-key", """
+        base: &b
+          tasks:
+            a:
+              desc: merged
+        <<: *b
+    """, True),
+    ("non-str-key", """
+        tasks:
+          1:
+            desc: numeric
+    """, True),
+    ("no-tasks", """
+        version: '3'
+    """, False),
+    ("tasks-after-other-keys", """
+        tasks:
+          a:
+            desc: x
+        version: '3'
+        vars: {A: [1]}
+    """, False),
+    ("duplicate-tasks", """
+        tasks:
+          a:
+            desc: first
+        tasks:
+          b:
+            desc: second
+    """, True),
+]
+
+
+def _launcher(path: Path) -> TaskfileLauncher:
+    """创建只设置了路径的实例，避免触发加载和缓存"""
+    launcher = TaskfileLauncher.__new__(TaskfileLauncher)
+    launcher.taskfile_path = path
+    return launcher
+
+
+def _visible(tasks: dict) -> dict:
+    """只保留启动器会读取的字段，非映射形式的任务视为空"""
+    return {
+        name: ({k: v for k, v in info.items() if k in _TASK_FIELDS} if isinstance(info, dict) else {})
+        for name, info in tasks.items()
+    }
+
+
+@pytest.mark.parametrize("loader", LOADERS, ids=lambda l: l.__name__)
+@pytest.mark.parametrize("name, content, falls_back", CASES, ids=[c[0] for c in CASES])
+def test_quick_scan_matches_safe_load(tmp_path, loader, name, content, falls_back):
+    path = tmp_path / "Taskfile.yml"
+    path.write_text(textwrap.dedent(content), encoding="utf-8")
+    expected = _visible(yaml.safe_load(path.read_text(encoding="utf-8")).get("tasks", {}))
+
+    launcher = _launcher(path)
+    scanned = launcher._quick_scan_tasks(yaml, loader)
+
+    if falls_back:
+        assert scanned is None
+    else:
+        assert scanned == expected
+    assert _visible(launcher._parse_taskfile()) == expected
+
+
+@pytest.mark.parametrize("loader", LOADERS, ids=lambda l: l.__name__)
+def test_complex_root_key_falls_back_to_full_parse(tmp_path, loader):
+    path = tmp_path / "Taskfile.yml"
+    path.write_text("? [a, b]\n: 1\ntasks:\n  a:\n    desc: x\n", encoding="utf-8")
+    launcher = _launcher(path)
+
+    assert launcher._quick_scan_tasks(yaml, loader) is None
+    # safe_load 对不可哈希的键会报错，完整解析应保持相同行为
+    with pytest.raises(yaml.YAMLError):
+        launcher._parse_taskfile()
+
+
+@pytest.mark.parametrize("prompt, kind", [("yes", "text"), ("123", "text"), ("'ok? y/N'", "yesno"), ("~", "none")])
+def test_launcher_loads_non_string_prompts(tmp_path, monkeypatch, prompt, kind):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    path = tmp_path / "Taskfile.yml"
+    path.write_text(f"tasks:\n  a:\n    prompt: {prompt}\n    cmds: [echo hi]\n", encoding="utf-8")
+
+    assert TaskfileLauncher(path)._prompt_kind == {"a": kind}